@@ -124,6 +124,21 @@ class Setting:
         self.local = {}
         self.system = QtCore.QSettings(QtCore.QSettings.IniFormat, QtCore.QSettings.UserScope,
                                        'SScanSS 2', 'SScanSS 2')
+        self._observers = []
+
+    def addObserver(self, observer):
+        """Adds a callable that is invoked when a setting value changes e.g.
+        to invalidate values cached outside the settings
+
+        :param observer: callable with no arguments
+        :type observer: Callable[[], None]
+        """
+        self._observers.append(observer)
+
+    def _notify(self):
+        """Notifies registered observers of a change to the settings"""
+        for observer in self._observers:
+            observer()
 
     @staticmethod
     def default(key):
@@ -214,6 +229,7 @@ class Setting:
         self.local[key.value] = value
         if default:
             self.system.setValue(key.value, value)
+        self._notify()
 
     def reset(self, default=False):
         """Clear saved values of setting keys that belong to a Group. Keys without
@@ -226,6 +242,7 @@ class Setting:
         if default:
             for group in self.Group:
                 self.system.remove(group.value)
+        self._notify()
 
     def filename(self):
         """Returns full path of setting file
@@ -134,7 +134,15 @@ class Mesh:
         :param offset: 3 x 1 array of offsets for X, Y and Z axis
         :type offset: Union[numpy.ndarray, Vector3]
         """
-        self.vertices = self.vertices + offset
+        vertices = self._vertices
+        if vertices.dtype == np.float64:
+            # adding in-place avoids allocating a new vertex array on the
+            # undo/redo hot path
+            np.add(vertices, offset, out=vertices)
+        else:
+            self._vertices = vertices + offset
+        # bounds shift with the vertices so a full recompute is unnecessary
+        self.bounding_box.translate(offset)
 
     def transform(self, matrix):
         """performs in-place transformation of mesh
@@ -13,6 +13,48 @@ from ..math.vector import Vector3
 from ..scene.node import Node
 
 
+def _fkine_arrays(axes, homes, types, offsets):
+    """Computes the accumulated Quaternion-Vector pair of a kinematic chain
+    from contiguous link metadata arrays using the Hamilton product on raw
+    numpy arrays. This avoids the object churn of chaining
+    QuaternionVectorPair multiplications on the hot path.
+
+    :param axes: normalized joint axes, one row per link
+    :type axes: numpy.ndarray
+    :param homes: joint centres, one row per link
+    :type homes: numpy.ndarray
+    :param types: joint types (0 for revolute, 1 for prismatic)
+    :type types: numpy.ndarray
+    :param offsets: joint offsets, one per link
+    :type offsets: numpy.ndarray
+    :return: accumulated quaternion in [x, y, z, w] order and vector
+    :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+    """
+    q = np.array([0., 0., 0., 1.])
+    v = np.zeros(3)
+
+    for i in range(offsets.size):
+        if types[i] == 0:
+            half_angle = 0.5 * offsets[i]
+            s = math.sin(half_angle)
+            w2 = math.cos(half_angle)
+            u = axes[i] * s
+            x2, y2, z2 = u
+            v2 = Quaternion._rotate_array(w2, u, homes[i])
+        else:
+            w2, x2, y2, z2 = 1., 0., 0., 0.
+            v2 = homes[i] + axes[i] * offsets[i]
+
+        x1, y1, z1, w1 = q
+        v = v + Quaternion._rotate_array(w1, q[0:3], v2)
+        q = np.array([w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+                      w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+                      w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+                      w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2])
+
+    return q, v
+
+
 class SerialManipulator:
     """This class defines a open loop kinematic chain.
 
@@ -39,6 +81,11 @@ class SerialManipulator:
         self.order = custom_order if custom_order is not None else list(range(len(links)))
         self.revolute_index = [True if l.type == l.Type.Revolute else False for l in links]
 
+        # contiguous link metadata used by the forward kinematics kernel
+        self._axes = np.array([l.joint_axis.normalized for l in links]).reshape(-1, 3)
+        self._homes = np.array([l.home for l in links]).reshape(-1, 3)
+        self._types = np.array([0 if l.type == l.Type.Revolute else 1 for l in links], dtype=np.int8)
+
     def fkine(self, q, start_index=0, end_index=None, include_base=True, ignore_locks=False, setpoint=True):
         """Moves the manipulator to specified configuration and returns the forward kinematics
         transformation matrix of the manipulator. The transformation matrix can be computed for a subset
@@ -64,15 +111,21 @@ class SerialManipulator:
         start = 0 if start_index < 0 else start_index
         end = link_count if end_index is None or end_index > link_count else end_index
 
-        base = self.base if include_base and start == 0 else Matrix44.identity()
-        tool = self.tool if end == link_count else Matrix44.identity()
-
-        qs = QuaternionVectorPair.identity()
         for i in range(start, end):
             self.links[i].move(q[i], ignore_locks, setpoint)
-            qs *= self.links[i].quaterionVectorPair
 
-        return base @ qs.toMatrix() @ tool
+        # effective offsets are read back from the links so joint locks are respected
+        offsets = np.array([link.offset for link in self.links[start:end]])
+        acc_q, acc_v = _fkine_arrays(self._axes[start:end], self._homes[start:end], self._types[start:end], offsets)
+        qs = QuaternionVectorPair(Quaternion(acc_q[3], *acc_q[0:3]), Vector3(acc_v))
+
+        matrix = qs.toMatrix()
+        if include_base and start == 0:
+            matrix = self.base @ matrix
+        if end == link_count:
+            matrix = matrix @ self.tool
+
+        return matrix
 
     def fromUserFormat(self, q):
         """converts joint offset from user defined format to kinematic order
@@ -165,9 +218,9 @@ class SerialManipulator:
         :return: transformation matrix
         :rtype: Matrix44
         """
-        qs = QuaternionVectorPair.identity()
-        for link in self.links:
-            qs *= link.quaterionVectorPair
+        offsets = np.array([link.offset for link in self.links])
+        acc_q, acc_v = _fkine_arrays(self._axes, self._homes, self._types, offsets)
+        qs = QuaternionVectorPair(Quaternion(acc_q[3], *acc_q[0:3]), Vector3(acc_v))
 
         return self.base @ qs.toMatrix() @ self.tool
 
@@ -196,12 +249,10 @@ class SerialManipulator:
 
         qs = QuaternionVectorPair.identity()
         joint_pos = Vector3()
-        up = Vector3([0., 0., 1.])
         for link in self.links:
             qs *= link.quaterionVectorPair
-            rot = rotation_btw_vectors(up, link.joint_axis)
             m = Matrix44.identity()
-            m[0:3, 0:3] = qs.quaternion.toMatrix() @ rot
+            m[0:3, 0:3] = qs.quaternion.toMatrix() @ link.up_rotation
             m[0:3, 3] = joint_pos if link.type == Link.Type.Revolute else qs.vector
 
             m = base @ m
@@ -211,7 +262,9 @@ class SerialManipulator:
                 child.render_mode = None
 
                 node.addChild(child)
-            joint_pos = qs.vector
+            # the in-place multiply above writes into qs.vector so the previous
+            # joint position must be copied out instead of aliased
+            joint_pos = Vector3(np.array(qs.vector._data))
 
         return node
 
@@ -250,6 +303,17 @@ class Link:
         if self.joint_axis.length < 0.00001:
             raise ValueError('The joint axis cannot be a zero vector.')
 
+        self._axis_n = self.joint_axis.normalized
+        # rotation from the scene up axis to the joint axis is fixed so it is
+        # computed once instead of on every model rebuild
+        self.up_rotation = rotation_btw_vectors(np.array([0., 0., 1.]), self.joint_axis)
+
+        # skew-symmetric matrix of the normalized axis and its square used to
+        # build the link rotation matrix via Rodrigues' formula
+        ax, ay, az = self._axis_n
+        self._skew = np.array([[0., -az, ay], [az, 0., -ax], [-ay, ax, 0.]])
+        self._skew_2 = self._skew @ self._skew
+
         self.quaternion = Quaternion.fromAxisAngle(self.joint_axis, 0.0)
         self.vector = Vector3(point)
         self.home = Vector3(point)
@@ -280,10 +344,15 @@ class Link:
         self.offset = offset
         self.set_point = offset if setpoint else self.set_point
         if self.type == Link.Type.Revolute:
-            self.quaternion = Quaternion.fromAxisAngle(self.joint_axis, offset)
-            self.vector = self.quaternion.rotate(self.home)
+            q = Quaternion.fromAxisAngleNormalized(self._axis_n, offset)
+            self.quaternion = q
+            self.vector = Vector3(Quaternion._rotate_array(q.w, q._data[0:3], self.home._data))
         else:
-            self.vector = self.home + self.joint_axis * offset
+            # the normalized axis keeps this consistent with the forward
+            # kinematics kernel which also displaces along the unit axis
+            self.vector = self.home + self._axis_n * offset
+
+        self._qvp = QuaternionVectorPair(self.quaternion, self.vector)
 
     def reset(self):
         """
@@ -293,21 +362,29 @@ class Link:
 
     @property
     def transformationMatrix(self):
-        """pose of the link
+        """pose of the link. The rotation is built directly from the joint
+        axis and offset using Rodrigues' formula i.e. I + sin(a)K + (1-cos(a))K^2
+        which avoids the intermediate quaternion to matrix conversion
 
         :return: pose of the link
         :rtype: Matrix44
         """
-        return self.quaterionVectorPair.toMatrix()
+        m = Matrix44.identity()
+        if self.type == Link.Type.Revolute:
+            m[0:3, 0:3] += math.sin(self.offset) * self._skew + (1 - math.cos(self.offset)) * self._skew_2
+        m[0:3, 3] = self.vector
+
+        return m
 
     @property
     def quaterionVectorPair(self):
-        """pose of the link
+        """pose of the link. The pair is cached in move so repeated access
+        does not allocate
 
         :return: pose of the link
         :rtype: QuaternionVectorPair
         """
-        return QuaternionVectorPair(self.quaternion, self.vector)
+        return self._qvp
 
 
 def joint_space_trajectory(start_pose, stop_pose, step):
@@ -322,14 +399,15 @@ def joint_space_trajectory(start_pose, stop_pose, step):
     :return: array of configurations defining the trajectory
     :rtype: numpy.ndarray
     """
-    dof = len(start_pose)
-    trajectory = np.zeros((step, dof))
+    start_pose = np.asarray(start_pose, dtype=float)
+    stop_pose = np.asarray(stop_pose, dtype=float)
 
-    for i in range(dof):
-        t = cubic_polynomial_trajectory(start_pose[i], stop_pose[i], step=step)
-        trajectory[:, i] = t
+    # With zero boundary velocities, the cubic boundary value problem reduces
+    # to the Hermite basis h(s) = 3s^2 - 2s^3 in normalized time s
+    s = np.linspace(0.0, 1.0, step)[:, None]
+    h = s * s * (3 - 2 * s)
 
-    return trajectory
+    return start_pose + (stop_pose - start_pose) * h
 
 
 def cubic_polynomial_trajectory(p0, p1, step=100):
@@ -344,29 +422,7 @@ def cubic_polynomial_trajectory(p0, p1, step=100):
     :return: offsets in the trajectory
     :rtype: numpy.ndarray
     """
-
-    t0 = 0.0
-    tf = step
-    t = np.linspace(t0, tf, step)
-
-    t0_2 = t0 * t0
-    t0_3 = t0_2 * t0
-
-    tf_2 = tf * tf
-    tf_3 = tf_2 * tf
-
-    m = [[1.0, t0, t0_2, t0_3],
-         [0.0, 1.0, 2 * t0, 3 * t0_2],
-         [1.0, tf, tf_2, tf_3],
-         [0.0, 1.0, 2 * tf, 3 * tf_2]]
-
-    v0 = v1 = 0.0
-    b = [p0, v0, p1, v1]
-    a = np.dot(np.linalg.inv(m), b)
-
-    pd = np.polyval(a[::-1], t)
-
-    return pd
+    return joint_space_trajectory([p0], [p1], step)[:, 0]
 
 
 class Sequence(QtCore.QObject):
@@ -391,7 +447,9 @@ class Sequence(QtCore.QObject):
         self.timeline = QtCore.QTimeLine(duration, self)
         self.timeline.setFrameRange(0, step - 1)
 
-        self.trajectory = joint_space_trajectory(start, stop, step)
+        # animation frames do not need double precision and the smaller
+        # footprint helps the UI path the rows are handed to
+        self.trajectory = joint_space_trajectory(start, stop, step).astype(np.float32)
 
         self.timeline.setCurrentTime(self.timeline.duration())
         self.timeline.frameChanged.connect(self.animate)
@@ -541,12 +599,11 @@ class IKSolver:
         :return: objective error
         :rtype: float
         """
-        conf = self.start.copy()
+        conf = self.conf
         conf[self.active_joints] = q
-        H = self.robot.fkine(conf) @ self.robot.tool_link
+        H = self.robot.fkine(conf)
 
-        residuals = np.zeros(6)
-        residuals[0:3] = self.target_position - (H[0:3, 0:3] @ self.current_position + H[0:3, 3])
+        dx = self.target_position - (H[0:3, 0:3] @ self.current_position + H[0:3, 3])
 
         if self.current_orientation.shape[0] == 1:
             v1 = H[0:3, 0:3] @ self.current_orientation[0]
@@ -558,13 +615,13 @@ class IKSolver:
             result = rigid_transform(v1, v2)
             angle, axis = matrix_to_angle_axis(result.matrix)
 
-        residuals[3:6] = math.degrees(angle) * axis
-        error = np.dot(residuals, residuals)
+        dr = math.degrees(angle) * np.asarray(axis)
+        error = np.dot(dx, dx) + np.dot(dr, dr)
 
         if error < self.best_result and np.logical_and(
                  self.lower_bounds <= q, self.upper_bounds >= q).all():
             self.best_result = error
-            self.best_conf = conf
+            self.best_conf = conf.copy()
 
         if gradient.size > 0:
             gradient[:] = self.__gradient(q, 1e-8, error)
@@ -601,6 +658,8 @@ class IKSolver:
         self.best_result = np.inf
 
         self.start = self.best_conf if start is None else start
+        # scratch configuration reused across objective evaluations
+        self.conf = self.start.copy()
         self.active_joints = [not link.locked for link in self.robot.links]
         q0 = self.start[self.active_joints]
 
@@ -619,21 +678,31 @@ class IKSolver:
         self.upper_bounds = upper_bounds
         q0 = np.clip(q0, lower_bounds, upper_bounds)  # ensure starting config is bounded avoids crash
 
+        # The tool link is fixed during the solve so it is folded into the tool of
+        # the last manipulator in the stack, saving a 4x4 matmul per evaluation
+        last = self.robot.auxiliary[-1] if self.robot.auxiliary else self.robot.fixed
+        tool = last.tool
+        last.tool = tool @ self.robot.tool_link
+
         try:
-            self.__create_optimizer(q0.size, stop_eval_tol, lower_bounds, upper_bounds, local_max_eval, global_max_eval)
-            self.optimizer.optimize(q0)
-        except nlopt.RoundoffLimited:
-            logging.exception("Roundoff Error occurred during inverse kinematics")
-        except RuntimeError:
-            self.status = IKSolver.Status.Failed
-            logging.exception("Unknown runtime error occurred during inverse kinematics")
-
-        if self.status != IKSolver.Status.Failed:
-            self.residual_error = self.computeResidualError()
-            if self.residual_error[2] and self.residual_error[3]:
-                self.status = IKSolver.Status.Converged
-            else:
-                self.status = IKSolver.Status.NotConverged
+            try:
+                self.__create_optimizer(q0.size, stop_eval_tol, lower_bounds, upper_bounds, local_max_eval,
+                                        global_max_eval)
+                self.optimizer.optimize(q0)
+            except nlopt.RoundoffLimited:
+                logging.exception("Roundoff Error occurred during inverse kinematics")
+            except RuntimeError:
+                self.status = IKSolver.Status.Failed
+                logging.exception("Unknown runtime error occurred during inverse kinematics")
+
+            if self.status != IKSolver.Status.Failed:
+                self.residual_error = self.computeResidualError()
+                if self.residual_error[2] and self.residual_error[3]:
+                    self.status = IKSolver.Status.Converged
+                else:
+                    self.status = IKSolver.Status.NotConverged
+        finally:
+            last.tool = tool
 
         return IKResult(self.best_conf, self.status, *self.residual_error)
 
@@ -644,7 +713,7 @@ class IKSolver:
         :return: 3D position and orientation error and flags indicating convergence
         :rtype: Tuple[numpy.ndarray, numpy.ndarray, bool, bool]
         """
-        H = self.robot.fkine(self.best_conf) @ self.robot.tool_link
+        H = self.robot.fkine(self.best_conf)
         position_error = self.target_position - (H[0:3, 0:3] @ self.current_position + H[0:3, 3])
         position_error_good = False if trunc(np.linalg.norm(position_error), 3) > self.tolerance[0] else True
 
@@ -42,6 +42,9 @@ def map_range(old_min, old_max, new_min, new_max, value):
     return new_min + ((value - old_min) * (new_max - new_min) / (old_max - old_min))
 
 
+_POW_10 = tuple(10 ** i for i in range(16))
+
+
 def trunc(value, decimals=0):
     """Truncates values after a number of decimal points
 
@@ -52,7 +55,7 @@ def trunc(value, decimals=0):
     :return: truncated float
     :rtype: float
     """
-    step = 10 ** decimals
+    step = _POW_10[decimals] if 0 <= decimals < 16 else 10 ** decimals
     return math.trunc(value * step)/step
 
 
@@ -68,6 +71,9 @@ def is_close(a, b, tol=VECTOR_EPS):
     :return: indicates if values are close
     :rtype: bool
     """
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return abs(a - b) < tol
+
     if np.all(np.abs(np.subtract(a, b)) < tol):
         return True
     return False
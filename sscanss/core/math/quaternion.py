@@ -2,6 +2,7 @@
 Classes for Quaternion and Quaternion-Vector objects
 """
 import math
+import numpy as np
 from .constants import VECTOR_EPS
 from .vector import Vector3, Vector4
 from .matrix import Matrix33, Matrix44
@@ -9,6 +10,7 @@ from .matrix import Matrix33, Matrix44
 
 class Quaternion:
     """Creates a Quaternion object in the form w + xi + yj + zk.
+    The data is stored internally as a numpy array in the order [x, y, z, w].
 
     :param w: real part
     :type w: float
@@ -20,7 +22,7 @@ class Quaternion:
     :type z: float
     """
     def __init__(self, w=0.0, x=0.0, y=0.0, z=0.0):
-        self._data = Vector4([x, y, z, w])
+        self._data = np.array([x, y, z, w], dtype=float)
 
     def __array__(self, _dtype=None):
         return self._data[:]
@@ -41,11 +43,11 @@ class Quaternion:
         :return: coefficient of imaginary part i
         :rtype: float
         """
-        return self._data.x
+        return self._data[0]
 
     @x.setter
     def x(self, value):
-        self._data.x = value
+        self._data[0] = value
 
     @property
     def y(self):
@@ -54,11 +56,11 @@ class Quaternion:
         :return: coefficient of imaginary part j
         :rtype: float
         """
-        return self._data.y
+        return self._data[1]
 
     @y.setter
     def y(self, value):
-        self._data.y = value
+        self._data[1] = value
 
     @property
     def z(self):
@@ -67,11 +69,11 @@ class Quaternion:
         :return: coefficient of imaginary part k
         :rtype: float
         """
-        return self._data.z
+        return self._data[2]
 
     @z.setter
     def z(self, value):
-        self._data.z = value
+        self._data[2] = value
 
     @property
     def w(self):
@@ -80,11 +82,11 @@ class Quaternion:
         :return: real part
         :rtype: float
         """
-        return self._data.w
+        return self._data[3]
 
     @w.setter
     def w(self, value):
-        self._data.w = value
+        self._data[3] = value
 
     @property
     def axis(self):
@@ -92,11 +94,11 @@ class Quaternion:
 
         :rtype axis: Vector3
         """
-        return Vector3([self.x, self.y, self.z])
+        return Vector3(self._data[0:3])
 
     @axis.setter
     def axis(self, axis):
-        self._data.xyz = axis
+        self._data[0:3] = axis
 
     def conjugate(self):
         """Computes quaternion conjugate
@@ -104,7 +106,8 @@ class Quaternion:
         :return: conjugate of quaternion
         :rtype: Quaternion
         """
-        return self.__class__(self.w, -self.x, -self.y, -self.z)
+        x, y, z, w = self._data
+        return self.__class__(w, -x, -y, -z)
 
     @property
     def length(self):
@@ -113,7 +116,7 @@ class Quaternion:
         :return: length of quaternion
         :rtype: float
         """
-        return self._data.length
+        return np.linalg.norm(self._data)
 
     def toMatrix(self):
         """Converts quaternion into a rotation matrix
@@ -121,18 +124,20 @@ class Quaternion:
         :return: rotation matrix
         :rtype: Matrix33
         """
-        twoxx = 2 * self.x * self.x
-        twoyy = 2 * self.y * self.y
-        twozz = 2 * self.z * self.z
+        x, y, z, w = self._data
 
-        twowx = 2 * self.w * self.x
-        twowy = 2 * self.w * self.y
-        twowz = 2 * self.w * self.z
+        twoxx = 2 * x * x
+        twoyy = 2 * y * y
+        twozz = 2 * z * z
 
-        twoxy = 2 * self.x * self.y
-        twoxz = 2 * self.x * self.z
+        twowx = 2 * w * x
+        twowy = 2 * w * y
+        twowz = 2 * w * z
 
-        twoyz = 2 * self.y * self.z
+        twoxy = 2 * x * y
+        twoxz = 2 * x * z
+
+        twoyz = 2 * y * z
 
         return Matrix33([[1 - twoyy - twozz, twoxy - twowz, twoxz + twowy],
                          [twoxy + twowz, 1 - twoxx - twozz, twoyz - twowx],
@@ -144,12 +149,12 @@ class Quaternion:
         :return: rotation axis and angle in radians
         :rtype: Union[Vector3, float]
         """
-        angle = 2 * math.acos(self.w)
-        s = math.sqrt(1 - self.w * self.w)
+        w = self._data[3]
+        angle = 2 * math.acos(w)
         if angle < VECTOR_EPS:
             axis = Vector3()
         else:
-            axis = Vector3([self.x, self.y, self.z]) / s
+            axis = Vector3(self._data[0:3] / math.sqrt(1 - w * w))
 
         return axis, angle
 
@@ -169,8 +174,8 @@ class Quaternion:
         """
         length = self.length
         if length > VECTOR_EPS:
-            n = self._data.normalized
-            return self.__class__(n.w, n.x, n.y, n.z)
+            x, y, z, w = self._data / length
+            return self.__class__(w, x, y, z)
 
         return self.__class__()
 
@@ -184,20 +189,35 @@ class Quaternion:
         """
         return self._data.dot(q[:])
 
+    @staticmethod
+    def _rotate_array(w, u, v):
+        """Rotates a 3D point using the Euler-Rodrigues formula i.e.
+        v + 2w(u x v) + 2(u x (u x v)). This avoids the quaternion
+        allocations of the q * p * q^-1 expansion.
+
+        :param w: real part of a unit quaternion
+        :type w: float
+        :param u: imaginary part [i, j, k] of a unit quaternion
+        :type u: numpy.ndarray
+        :param v: 3D point
+        :type v: numpy.ndarray
+        :return: rotated point
+        :rtype: numpy.ndarray
+        """
+        t = 2 * np.cross(u, v)
+        return v + w * t + np.cross(u, t)
+
     def rotate(self, point):
-        """Rotate a 3D point with the quaternion
+        """Rotate a 3D point with the quaternion. The quaternion should be
+        normalized before rotating the point
 
         :param point: 3D point
         :type point: Vector3
         :return: rotated point
         :rtype: Vector3
         """
-        p = self.__class__(x=point[0], y=point[1], z=point[2])
-        q_inv = self.inverse()
-
-        rotated = self * p * q_inv
-
-        return rotated.axis
+        v = np.asarray(point, dtype=float)
+        return Vector3(self._rotate_array(self._data[3], self._data[0:3], v))
 
     def __getitem__(self, index):
         return self._data[index]
@@ -221,6 +241,23 @@ class Quaternion:
 
         return cls(w, x, y, z)
 
+    @classmethod
+    def fromAxisAngleNormalized(cls, axis, angle):
+        """Converts angle axis representation to quaternion. The axis must be
+        normalized by the caller which avoids a repeated square root when the
+        axis is fixed
+
+        :param axis: normalized axis of rotation
+        :type axis: Union[Vector3, numpy.ndarray]
+        :param angle: angle of rotation in radians
+        :type angle: float
+        :return: quaternion
+        :rtype: Quaternion
+        """
+        s = math.sin(angle / 2)
+
+        return cls(math.cos(angle / 2), axis[0] * s, axis[1] * s, axis[2] * s)
+
     @classmethod
     def fromMatrix(cls, matrix):
         """Converts rotation matrix to quaternion
@@ -272,16 +309,13 @@ class Quaternion:
         return "[{} <{} {} {}>]".format(self.w, *self.axis)
 
     def __mul__(self, other):
-        w1 = self.w
-        w2 = other.w
-
-        v1 = self.axis
-        v2 = other.axis
+        x1, y1, z1, w1 = self._data
+        x2, y2, z2, w2 = other._data
 
-        w = w1 * w2 - (v1 | v2)
-        v = w1 * v2 + w2 * v1 + (v1 ^ v2)
-
-        return self.__class__(w, *v)
+        return self.__class__(w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+                              w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+                              w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+                              w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2)
 
     def __or__(self, other):
         return self.dot(other)
@@ -310,33 +344,63 @@ class QuaternionVectorPair:
         return self.__class__(q, v)
 
     def __imul__(self, other):
-        temp = self.__mul__(other)
-        self.quaternion = temp.quaternion
-        self.vector = temp.vector
+        if not isinstance(other, self.__class__):
+            raise ValueError('cannot multiply {} with QuaternionVectorPair'.format(type(other)))
+
+        x1, y1, z1, w1 = self.quaternion._data
+        x2, y2, z2, w2 = other.quaternion._data
+
+        v = Quaternion._rotate_array(w1, self.quaternion._data[0:3], other.vector._data) + self.vector._data
+
+        self.quaternion._data[:] = (w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+                                    w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+                                    w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+                                    w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2)
+        self.vector._data[:] = v
+
         return self
 
     def inverse(self):
-        """Computes inverse of Quaternion-Vector pair
+        """Computes inverse of Quaternion-Vector pair. The conjugate is used
+        as the quaternion inverse since the pair represents a rigid
+        transformation i.e. quaternion is unit
 
         :return: inverse of Quaternion-Vector pair
         :rtype: QuaternionVectorPair
         """
-        q = self.quaternion.inverse()
+        q = self.quaternion.conjugate()
         v = -q.rotate(self.vector)
 
         return self.__class__(q, v)
 
     def toMatrix(self):
-        """Converts Quaternion-Vector pair to homogeneous transformation matrix
+        """Converts Quaternion-Vector pair to homogeneous transformation matrix.
+        The rotation block is stamped directly from the quaternion components
+        to avoid the intermediate Matrix33
 
         :return: homogeneous transformation matrix
-        :rtype: matrix44
+        :rtype: Matrix44
         """
-        m = Matrix44.identity()
-        m[0:3, 0:3] = self.quaternion.toMatrix()
-        m[0:3, 3] = self.vector
+        x, y, z, w = self.quaternion._data
+        vx, vy, vz = self.vector._data
+
+        twoxx = 2 * x * x
+        twoyy = 2 * y * y
+        twozz = 2 * z * z
+
+        twowx = 2 * w * x
+        twowy = 2 * w * y
+        twowz = 2 * w * z
+
+        twoxy = 2 * x * y
+        twoxz = 2 * x * z
+
+        twoyz = 2 * y * z
 
-        return m
+        return Matrix44([[1 - twoyy - twozz, twoxy - twowz, twoxz + twowy, vx],
+                         [twoxy + twowz, 1 - twoxx - twozz, twoyz - twowx, vy],
+                         [twoxz - twowy, twoyz + twowx, 1 - twoxx - twoyy, vz],
+                         [0., 0., 0., 1.]])
 
     @classmethod
     def fromMatrix(cls, matrix):
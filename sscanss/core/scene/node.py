@@ -1,16 +1,36 @@
 """
 Class and functions for scene node
 """
-from enum import Enum, unique
+from collections import deque
+from enum import IntEnum, unique
+from functools import lru_cache
 import numpy as np
 from ..math.matrix import Matrix44
 from ..math.transform import rotation_btw_vectors
 from ..geometry.colour import Colour
 from ..geometry.primitive import create_sphere, create_plane, create_cuboid
-from ..geometry.mesh import BoundingBox
+from ..geometry.mesh import BoundingBox, Mesh
 from ..util.misc import Attributes
 from ...config import settings
 
+_IDENTITY = np.eye(4)
+
+
+@lru_cache(maxsize=None)
+def _setting_colour(key):
+    """Returns the colour stored in the settings with the given key. The
+    resolved colours are cached and invalidated when a setting changes
+
+    :param key: setting key
+    :type key: Enum
+    :return: colour
+    :rtype: Colour
+    """
+    return Colour(*settings.value(key))
+
+
+settings.addObserver(_setting_colour.cache_clear)
+
 
 class Node:
     """Creates Node object.
@@ -19,16 +39,21 @@ class Node:
     :type mesh: Union[Mesh, None]
     """
     @unique
-    class RenderMode(Enum):
-        Solid = 'Solid'
-        Wireframe = 'Wireframe'
-        Transparent = 'Transparent'
-        Outline = 'Outline'
+    class RenderMode(IntEnum):
+        """Integer values make the per-node comparisons in the render loop
+        plain int equality instead of string comparison"""
+        Solid = 0
+        Wireframe = 1
+        Transparent = 2
+        Outline = 3
 
     @unique
-    class RenderPrimitive(Enum):
-        Lines = 'Lines'
-        Triangles = 'Triangles'
+    class RenderPrimitive(IntEnum):
+        Lines = 0
+        Triangles = 1
+
+    __slots__ = ('_vertices', 'indices', 'normals', '_bounding_box', '_colour', '_render_mode', 'render_primitive',
+                 '_transform', '_transformed_bounds', '_has_geometry', 'parent', '_visible', 'selected', 'children')
 
     def __init__(self, mesh=None):
         if mesh is None:
@@ -37,16 +62,20 @@ class Node:
             self.normals = np.array([])
             self._bounding_box = None
             self._colour = Colour.black()
+            self._has_geometry = False
         else:
-            self._vertices = mesh.vertices
+            self._vertices = np.ascontiguousarray(mesh.vertices, dtype=np.float32)
             self.indices = mesh.indices
-            self.normals = mesh.normals
+            self.normals = np.ascontiguousarray(mesh.normals, dtype=np.float32)
             self._bounding_box = mesh.bounding_box
             self._colour = mesh.colour
+            self._has_geometry = len(mesh.vertices) != 0
 
         self._render_mode = Node.RenderMode.Solid
         self.render_primitive = Node.RenderPrimitive.Triangles
-        self.transform = Matrix44.identity()
+        self._transformed_bounds = None
+        # copying the prebuilt identity is cheaper than np.eye per node
+        self.transform = Matrix44(_IDENTITY)
         self.parent = None
         self._visible = True
         self.selected = False
@@ -62,6 +91,7 @@ class Node:
         """
         node = Node()
         node._vertices = self._vertices
+        node._has_geometry = self._has_geometry
         node.indices = self.indices
         node.normals = self.normals
         node.bounding_box = self.bounding_box
@@ -82,16 +112,22 @@ class Node:
 
     @vertices.setter
     def vertices(self, value):
-        """Updates the bounding box of the node when vertices are changed
+        """Updates the bounding box of the node when vertices are changed.
+        Vertices are stored as contiguous float32 which matches the upload
+        format expected by the graphics driver
 
         :param value: N x 3 array of vertices
         :type value: numpy.ndarray
         """
-        self._vertices = value
+        self._vertices = np.ascontiguousarray(value, dtype=np.float32)
+        self._has_geometry = len(value) != 0
         max_pos, min_pos = BoundingBox.fromPoints(self._vertices).bounds
-        for node in self.children:
-            max_pos = np.maximum(node.bounding_box.max, max_pos)
-            min_pos = np.minimum(node.bounding_box.min, min_pos)
+        if self.children:
+            bounds = [node.bounding_box.bounds for node in self.children]
+            bounds.append((max_pos, min_pos))
+            maxs, mins = zip(*bounds)
+            max_pos = np.max(maxs, axis=0)
+            min_pos = np.min(mins, axis=0)
         self.bounding_box = BoundingBox(max_pos, min_pos)
 
     @property
@@ -133,9 +169,7 @@ class Node:
         :return: indicates node is empty
         :rtype: bool
         """
-        if not self.children and len(self.vertices) == 0:
-            return True
-        return False
+        return not self.children and not self._has_geometry
 
     def addChild(self, child_node):
         """Adds child to the node and recomputes the bounding box to include child
@@ -155,6 +189,31 @@ class Node:
             min_pos = np.minimum(self.bounding_box.min, min_pos)
         self.bounding_box = BoundingBox(max_pos, min_pos)
 
+    def addChildren(self, child_nodes):
+        """Adds multiple children to the node and recomputes the bounding box
+        once instead of merging incrementally per child
+
+        :param child_nodes: child nodes to add
+        :type child_nodes: List[Node]
+        """
+        added = []
+        for child_node in child_nodes:
+            if child_node.isEmpty():
+                continue
+
+            child_node.parent = self
+            self.children.append(child_node)
+            added.append(child_node)
+
+        if not added:
+            return
+
+        bounds = [node.bounding_box.bounds for node in added]
+        if self.bounding_box is not None:
+            bounds.append(self.bounding_box.bounds)
+        maxs, mins = zip(*bounds)
+        self.bounding_box = BoundingBox(np.max(maxs, axis=0), np.min(mins, axis=0))
+
     def translate(self, offset):
         """Translates node
 
@@ -164,37 +223,81 @@ class Node:
         if self.isEmpty():
             return
 
-        self.transform @= Matrix44.fromTranslation(offset)
+        # equivalent to transform @ fromTranslation(offset) without building
+        # and multiplying a second 4 x 4 matrix
+        transform = self._transform
+        transform[0:3, 3] += transform[0:3, 0:3] @ offset
+        self._transformed_bounds = None
 
     def flatten(self):
-        """Recursively flattens the tree formed by nested nodes
+        """Flattens the tree formed by nested nodes. The tree is traversed
+        iteratively with an explicit stack which avoids the per-level Node
+        allocations and list copies of a recursive walk
 
         :return: flattened node
         :rtype: Node
         """
         new_node = Node()
         new_node.bounding_box = self.bounding_box
-        for node in self.children:
-            if node.children:
-                new_node.children.extend(node.flatten().children)
+        children = new_node.children
+
+        stack = deque((child, False) for child in self.children)
+        while stack:
+            node, processed = stack.popleft()
+            if processed:
+                children.append(node)
+            elif node.children:
+                front = [(child, False) for child in node.children]
+                if node._has_geometry:
+                    parent = node.copy()
+                    parent.vertices = node.vertices
+                    front.append((parent, True))
+                stack.extendleft(reversed(front))
             elif not node.isEmpty():
                 node.parent = None
-                new_node.children.append(node)
+                children.append(node)
 
-        if len(self.vertices) != 0:
+        if self._has_geometry:
             parent = self.copy()
             parent.vertices = self.vertices
-            new_node.children.append(parent)
+            children.append(parent)
 
         return new_node
 
+    @property
+    def transform(self):
+        return self._transform
+
+    @transform.setter
+    def transform(self, value):
+        """Invalidates the cached world bounding box when the transform changes
+
+        :param value: transformation matrix
+        :type value: Matrix44
+        """
+        self._transform = value
+        self._transformed_bounds = None
+
     @property
     def bounding_box(self):
-        return None if self._bounding_box is None else self._bounding_box.transform(self.transform)
+        """world bounding box of the node. The transformed box is cached and
+        recomputed only when the transform or untransformed bounds change
+
+        :return: world bounding box
+        :rtype: Union[BoundingBox, None]
+        """
+        if self._bounding_box is None:
+            return None
+
+        if self._transformed_bounds is None:
+            self._transformed_bounds = self._bounding_box.transform(self.transform)
+
+        return self._transformed_bounds
 
     @bounding_box.setter
     def bounding_box(self, value):
         self._bounding_box = value
+        self._transformed_bounds = None
 
 
 def create_sample_node(samples, render_mode=Node.RenderMode.Solid):
@@ -208,15 +311,17 @@ def create_sample_node(samples, render_mode=Node.RenderMode.Solid):
     :rtype: Node
     """
     sample_node = Node()
-    sample_node.colour = Colour(*settings.value(settings.Key.Sample_Colour))
+    sample_node.colour = _setting_colour(settings.Key.Sample_Colour)
     sample_node.render_mode = render_mode
 
+    children = []
     for sample_mesh in samples.values():
         child = Node(sample_mesh)
         child.colour = None
         child.render_mode = None
 
-        sample_node.addChild(child)
+        children.append(child)
+    sample_node.addChildren(children)
 
     return sample_node
 
@@ -234,19 +339,27 @@ def create_fiducial_node(fiducials, visible=True):
     fiducial_node = Node()
     fiducial_node.visible = visible
     fiducial_node.render_mode = Node.RenderMode.Solid
-    enabled_colour = Colour(*settings.value(settings.Key.Fiducial_Colour))
-    disabled_colour = Colour(*settings.value(settings.Key.Fiducial_Disabled_Colour))
+    enabled_colour = _setting_colour(settings.Key.Fiducial_Colour)
+    disabled_colour = _setting_colour(settings.Key.Fiducial_Disabled_Colour)
     size = settings.value(settings.Key.Fiducial_Size)
-    for point, enabled in fiducials:
-        fiducial_mesh = create_sphere(size)
-        fiducial_mesh.translate(point)
+    if len(fiducials) == 0:
+        return fiducial_node
+
+    # the sphere is tessellated once, vertices for every point are produced
+    # by a single broadcast and the indices and normals are shared
+    sphere = create_sphere(size)
+    vertices = sphere.vertices[None, :, :] + fiducials.points[:, None, :]
+    children = []
+    for index, enabled in enumerate(fiducials.enabled):
+        fiducial_mesh = Mesh(vertices[index], sphere.indices, sphere.normals)
 
         child = Node(fiducial_mesh)
         child.colour = enabled_colour if enabled else disabled_colour
         child.render_mode = None
         child.visible = None
 
-        fiducial_node.addChild(child)
+        children.append(child)
+    fiducial_node.addChildren(children)
 
     return fiducial_node
 
@@ -264,27 +377,32 @@ def create_measurement_point_node(points, visible=True):
     measurement_point_node = Node()
     measurement_point_node.visible = visible
     measurement_point_node.render_mode = Node.RenderMode.Solid
-    enabled_colour = Colour(*settings.value(settings.Key.Measurement_Colour))
-    disabled_colour = Colour(*settings.value(settings.Key.Measurement_Disabled_Colour))
+    if len(points) == 0:
+        return measurement_point_node
+
+    enabled_colour = _setting_colour(settings.Key.Measurement_Colour)
+    disabled_colour = _setting_colour(settings.Key.Measurement_Disabled_Colour)
     size = settings.value(settings.Key.Measurement_Size)
-    for point, enabled in points:
-        x, y, z = point
 
+    # cross vertices for all points are built with a single broadcast instead
+    # of a small array allocation per point
+    offsets = size * np.array([[-1., 0., 0.], [1., 0., 0.], [0., -1., 0.],
+                               [0., 1., 0.], [0., 0., -1.], [0., 0., 1.]])
+    vertices = points.points[:, None, :] + offsets[None, :, :]
+    indices = np.array([0, 1, 2, 3, 4, 5])
+
+    children = []
+    for index, enabled in enumerate(points.enabled):
         child = Node()
-        child.vertices = np.array([[x - size, y, z],
-                                   [x + size, y, z],
-                                   [x, y - size, z],
-                                   [x, y + size, z],
-                                   [x, y, z - size],
-                                   [x, y, z + size]])
-
-        child.indices = np.array([0, 1, 2, 3, 4, 5])
+        child.vertices = vertices[index]
+        child.indices = indices
         child.colour = enabled_colour if enabled else disabled_colour
         child.render_mode = None
         child.visible = None
         child.render_primitive = Node.RenderPrimitive.Lines
 
-        measurement_point_node.addChild(child)
+        children.append(child)
+    measurement_point_node.addChildren(children)
 
     return measurement_point_node
 
@@ -311,29 +429,37 @@ def create_measurement_vector_node(points, vectors, alignment, visible=True):
 
     alignment = 0 if alignment >= vectors.shape[2] else alignment
     size = settings.value(settings.Key.Vector_Size)
-    colours = [Colour(*settings.value(settings.Key.Vector_1_Colour)),
-               Colour(*settings.value(settings.Key.Vector_2_Colour))]
-
+    colours = [_setting_colour(settings.Key.Vector_1_Colour),
+               _setting_colour(settings.Key.Vector_2_Colour)]
+
+    start_point = points.points
+    num_detectors = vectors.shape[1] // 3
+    # extra detector colours are drawn from a seeded local generator so the
+    # global random state is not reseeded inside the loop
+    for j in range(2, num_detectors):
+        colours.append(Colour(*np.random.RandomState(j).random_sample(3)))
+    # start/end vertex pairs for every (alignment, detector) combination are
+    # assembled into one contiguous buffer with two broadcasts; each child
+    # then takes a view of its slice
+    end_points = start_point[:, None, :, None] + size * vectors.reshape(len(points), num_detectors, 3, -1)
+    vertices = np.empty((vectors.shape[2], num_detectors, 2 * len(points), 3), dtype=np.float32)
+    vertices[:, :, 0::2] = start_point
+    vertices[:, :, 1::2] = end_points.transpose(3, 1, 0, 2)
+    indices = np.arange(2 * len(points))
+
+    children = []
     for k in range(vectors.shape[2]):
-        start_point = points.points
-        for j in range(0, vectors.shape[1]//3):
-            end_point = start_point + size * vectors[:, j*3:j*3+3, k]
-
-            vertices = np.column_stack((start_point, end_point)).reshape(-1, 3)
-
+        for j in range(num_detectors):
             child = Node()
-            child.vertices = vertices
-            child.indices = np.arange(vertices.shape[0])
-            if j < 2:
-                child.colour = colours[j]
-            else:
-                np.random.seed(j)
-                child.colour = Colour(*np.random.random(3))
+            child.vertices = vertices[k, j]
+            child.indices = indices
+            child.colour = colours[j]
             child.render_mode = None
             child.visible = alignment == k
             child.render_primitive = Node.RenderPrimitive.Lines
 
-            measurement_vector_node.addChild(child)
+            children.append(child)
+    measurement_vector_node.addChildren(children)
 
     return measurement_vector_node
 
@@ -354,7 +480,7 @@ def create_plane_node(plane, width, height):
 
     node = Node(plane_mesh)
     node.render_mode = Node.RenderMode.Transparent
-    node.colour = Colour(*settings.value(settings.Key.Cross_Sectional_Plane_Colour))
+    node.colour = _setting_colour(settings.Key.Cross_Sectional_Plane_Colour)
 
     return node
 
@@ -391,11 +517,21 @@ def create_beam_node(instrument, bounds, visible=False):
     depth = max(bound_min, bound_max)
 
     mesh = create_cuboid(width, height, depth)
-    m = Matrix44.fromTranslation(beam_source)
-    m[0:3, 0:3] = rotation_btw_vectors(beam_direction, cuboid_axis)
-    m = m @ Matrix44.fromTranslation([0., -depth/2, 0.])
+    # the transform is assembled in-place; the [0, -depth/2, 0] offset
+    # rotates onto the second column of the rotation matrix
+    rot = rotation_btw_vectors(beam_direction, cuboid_axis)
+    m = Matrix44.identity()
+    m[0:3, 0:3] = rot
+    m[0:3, 3] = beam_source - (depth / 2) * rot[0:3, 1]
     mesh.transform(m)
 
+    # submeshes are gathered and concatenated once instead of reallocating
+    # the combined mesh after each detector
+    vertex_chunks = [mesh.vertices]
+    index_chunks = [mesh.indices]
+    normal_chunks = [mesh.normals]
+    vertex_count = mesh.vertices.shape[0]
+
     if instrument.beam_in_gauge_volume:
         for index, detector in enumerate(detectors.values()):
             if detector.current_collimator is None:
@@ -404,10 +540,15 @@ def create_beam_node(instrument, bounds, visible=False):
             bound_min = np.dot(bounds.min - gauge_volume, detector.diffracted_beam)
             depth = max(bound_min, bound_max)
             sub_mesh = create_cuboid(width, height, depth)
-            m = Matrix44.fromTranslation(gauge_volume)
-            m[0:3, 0:3] = rotation_btw_vectors(cuboid_axis, detector.diffracted_beam)
-            m = m @ Matrix44.fromTranslation([0., depth/2, 0.])
-            mesh.append(sub_mesh.transformed(m))
+            rot = rotation_btw_vectors(cuboid_axis, detector.diffracted_beam)
+            m = Matrix44.identity()
+            m[0:3, 0:3] = rot
+            m[0:3, 3] = gauge_volume + (depth / 2) * rot[0:3, 1]
+            sub_mesh.transform(m)
+            vertex_chunks.append(sub_mesh.vertices)
+            index_chunks.append(sub_mesh.indices + vertex_count)
+            normal_chunks.append(sub_mesh.normals)
+            vertex_count += sub_mesh.vertices.shape[0]
 
             # draw q_vector
             end_point = gauge_volume + q_vectors[index] * depth/2
@@ -420,9 +561,10 @@ def create_beam_node(instrument, bounds, visible=False):
             child.render_primitive = Node.RenderPrimitive.Lines
             node.addChild(child)
 
-    node.vertices = mesh.vertices
-    node.indices = mesh.indices
-    node.normals = mesh.normals
+    node.vertices = np.concatenate(vertex_chunks) if len(vertex_chunks) > 1 else mesh.vertices
+    node.indices = np.concatenate(index_chunks) if len(index_chunks) > 1 else mesh.indices
+    node.normals = np.ascontiguousarray(np.concatenate(normal_chunks) if len(normal_chunks) > 1 else mesh.normals,
+                                        dtype=np.float32)
 
     return node
 
@@ -439,22 +581,24 @@ def create_instrument_node(instrument, return_ids=False):
     """
     node = Node()
 
+    # each component model is flattened exactly once and its children are
+    # added directly so the full tree is never flattened a second time
     count = 0
-    model = instrument.positioning_stack.model()
-    count += len(model.flatten().children)
+    flat = instrument.positioning_stack.model().flatten()
+    count += len(flat.children)
     cache = {Attributes.Positioner.value: count}
-    node.addChild(model)
+    node.addChildren(flat.children)
 
     for detector in instrument.detectors.values():
-        model = detector.model()
-        count += len(model.flatten().children)
+        flat = detector.model().flatten()
+        count += len(flat.children)
         cache[f'{Attributes.Detector.value}_{detector.name}'] = count
-        node.addChild(model)
+        node.addChildren(flat.children)
 
-    model = instrument.jaws.model()
-    count += len(model.flatten().children)
+    flat = instrument.jaws.model().flatten()
+    count += len(flat.children)
     cache[Attributes.Jaws.value] = count
-    node.addChild(model)
+    node.addChildren(flat.children)
 
     for name, model in instrument.fixed_hardware.items():
         count += 1
@@ -462,5 +606,5 @@ def create_instrument_node(instrument, return_ids=False):
         node.addChild(Node(model))
 
     if return_ids:
-        return node.flatten(), cache
-    return node.flatten()
+        return node, cache
+    return node
@@ -6,7 +6,7 @@ from PyQt5 import QtWidgets
 from sscanss.core.util import (Primitives, Worker, PointType, LoadVector, MessageSeverity, StrainComponents,
                                CommandID, Attributes)
 from sscanss.core.geometry import (create_tube, create_sphere, create_cylinder, create_cuboid,
-                                   closest_triangle_to_point, compute_face_normals)
+                                   closest_triangle_to_point, compute_face_normals, Mesh, Colour)
 
 
 class InsertPrimitive(QtWidgets.QUndoCommand):
@@ -172,14 +172,24 @@ class MergeSample(QtWidgets.QUndoCommand):
         self.setText('Merge {} Samples'.format(len(sample_keys)))
 
     def redo(self):
+        # the merged arrays are assembled with one concatenation each instead
+        # of repeatedly reallocating the combined mesh per append
         self.merged_mesh = []
         samples = self.model.sample
-        new_mesh = samples.pop(self.keys[0], None)
-        self.merged_mesh.append((self.keys[0], 0))
-        for i in range(1, len(self.keys)):
-            old_mesh = samples.pop(self.keys[i], None)
-            self.merged_mesh.append((self.keys[i], new_mesh.indices.size))
-            new_mesh.append(old_mesh)
+        meshes = [samples.pop(key, None) for key in self.keys]
+
+        index_count = 0
+        vertex_count = 0
+        index_chunks = []
+        for key, mesh in zip(self.keys, meshes):
+            self.merged_mesh.append((key, index_count))
+            index_chunks.append(mesh.indices + vertex_count if vertex_count else mesh.indices)
+            index_count += mesh.indices.size
+            vertex_count += mesh.vertices.shape[0]
+
+        vertices = np.concatenate([mesh.vertices for mesh in meshes])
+        normals = np.concatenate([mesh.normals for mesh in meshes])
+        new_mesh = Mesh(vertices, np.concatenate(index_chunks), normals, Colour(*meshes[0].colour))
 
         self.model.addMeshToProject(self.new_name, new_mesh, combine=True)
 
@@ -243,12 +253,11 @@ class ChangeMainSample(QtWidgets.QUndoCommand):
         return True
 
     def reorderSample(self, new_keys):
-        new_sample = {}
-        for key in new_keys:
-            if key in self.model.sample:
-                new_sample[key] = self.model.sample[key]
+        sample = self.model.sample
+        if list(sample.keys()) == new_keys:
+            return
 
-        self.model.sample = OrderedDict(new_sample)
+        self.model.sample = OrderedDict((key, sample[key]) for key in new_keys if key in sample)
 
     def id(self):
         """Returns ID used when merging commands"""
@@ -385,11 +394,18 @@ class DeletePoints(QtWidgets.QUndoCommand):
             self.setText('Delete {} Point'.format(self.point_type.value))
 
     def redo(self):
+        # a single boolean mask selects the removed rows for both the points
+        # and the vectors
         if self.point_type == PointType.Fiducial:
-            self.removed_points = self.model.fiducials[self.indices]
+            points = self.model.fiducials
         else:
-            self.removed_points = self.model.measurement_points[self.indices]
-            self.removed_vectors = self.model.measurement_vectors[self.indices, :, :]
+            points = self.model.measurement_points
+
+        mask = np.zeros(points.size, dtype=bool)
+        mask[self.indices] = True
+        self.removed_points = points[mask]
+        if self.point_type != PointType.Fiducial:
+            self.removed_vectors = self.model.measurement_vectors[mask, :, :]
 
         self.model.removePointsFromProject(self.indices, self.point_type)
 
@@ -404,13 +420,24 @@ class DeletePoints(QtWidgets.QUndoCommand):
             self.model.measurement_vectors = vectors
 
     def reinsert(self, array, removed_array):
-        for index, value in enumerate(self.indices):
-            if index < len(array):
-                array = np.insert(array, value, removed_array[index], 0)
-            else:
-                array = np.append(array, removed_array[index:index+1], 0)
+        """Restores removed rows to their original indices in a single pass
+        instead of one np.insert per removed row
+
+        :param array: array to restore rows into
+        :type array: numpy.ndarray
+        :param removed_array: removed rows
+        :type removed_array: numpy.ndarray
+        :return: array with removed rows restored
+        :rtype: numpy.ndarray
+        """
+        total = len(array) + len(removed_array)
+        restored = np.empty((total, *array.shape[1:]), dtype=array.dtype)
+        mask = np.ones(total, dtype=bool)
+        mask[self.indices] = False
+        restored[self.indices] = removed_array
+        restored[mask] = array
 
-        return array
+        return restored
 
 
 class MovePoints(QtWidgets.QUndoCommand):
@@ -434,29 +461,35 @@ class MovePoints(QtWidgets.QUndoCommand):
         self.point_type = point_type
 
         count = len(self.model.fiducials) if point_type == PointType.Fiducial else len(self.model.measurement_points)
-        self.old_order = list(range(0, count))
-        self.new_order = self.old_order.copy()
-        self.new_order[move_from], self.new_order[move_to] = self.new_order[move_to], self.new_order[move_from]
+        self.new_order = np.arange(count)
+        self.new_order[[move_from, move_to]] = self.new_order[[move_to, move_from]]
 
         self.setText('Change {} Point Index'.format(self.point_type.value))
 
     def redo(self):
-        if self.point_type == PointType.Fiducial:
-            self.model.fiducials[self.old_order] = self.model.fiducials[self.new_order]
-            self.model.notifyChange(Attributes.Fiducials)
-        else:
-            self.model.measurement_points[self.old_order] = self.model.measurement_points[self.new_order]
-            self.model.measurement_vectors[self.old_order, :, :] = self.model.measurement_vectors[self.new_order, :, :]
-            self.model.notifyChange(Attributes.Measurements)
-            self.model.notifyChange(Attributes.Vectors)
+        self.reorder(self.new_order)
 
     def undo(self):
+        # the inverse permutation is computed here instead of being stored
+        # because mergeWith can change new_order after this command is pushed
+        self.reorder(np.argsort(self.new_order))
+
+    def reorder(self, order):
+        """Reorders the points (and vectors for measurement points) with the given
+        permutation using a single take per array
+
+        :param order: permutation of the point indices
+        :type order: numpy.ndarray
+        """
         if self.point_type == PointType.Fiducial:
-            self.model.fiducials[self.new_order] = self.model.fiducials[self.old_order]
+            points = self.model.fiducials
+            points[...] = points.take(order, axis=0)
             self.model.notifyChange(Attributes.Fiducials)
         else:
-            self.model.measurement_points[self.new_order] = self.model.measurement_points[self.old_order]
-            self.model.measurement_vectors[self.new_order, :, :] = self.model.measurement_vectors[self.old_order, :, :]
+            points = self.model.measurement_points
+            points[...] = points.take(order, axis=0)
+            vectors = self.model.measurement_vectors
+            vectors[...] = vectors.take(order, axis=0)
             self.model.notifyChange(Attributes.Measurements)
             self.model.notifyChange(Attributes.Vectors)
 
@@ -466,9 +499,9 @@ class MovePoints(QtWidgets.QUndoCommand):
 
         move_to = command.move_to
         move_from = command.move_from
-        self.new_order[move_from], self.new_order[move_to] = self.new_order[move_to], self.new_order[move_from]
+        self.new_order[[move_from, move_to]] = self.new_order[[move_to, move_from]]
 
-        if self.new_order == self.old_order:
+        if np.array_equal(self.new_order, np.arange(self.new_order.size)):
             self.setObsolete(True)
 
         return True
@@ -17,29 +17,39 @@ class RotateSample(QtWidgets.QUndoCommand):
         """
         super().__init__()
         self.angles = Vector3(np.radians(angles))
+        # the matrix is computed once and reused since redo/undo can be
+        # triggered many times on the same command
+        self.matrix = matrix_from_xyz_eulers(self.angles)
+        self.inverse = self.matrix.transpose()
         self.key = sample_key
         self.model = presenter.model
 
         self.setText('Rotate Sample ({})'.format(self.key))
 
     def redo(self):
-        matrix = matrix_from_xyz_eulers(self.angles)
-        self.rotate(matrix)
+        self.rotate(self.matrix)
 
     def undo(self):
-        matrix = matrix_from_xyz_eulers(self.angles)
-        self.rotate(matrix.transpose())
+        self.rotate(self.inverse)
 
     def rotate(self, matrix):
         if self.key is not None:
             mesh = self.model.sample[self.key]
             mesh.rotate(matrix)
         else:
-            for key in self.model.sample.keys():
-                mesh = self.model.sample[key]
-                mesh.rotate(matrix)
-
             _matrix = matrix.transpose()
+
+            # vertices and normals of all the samples are rotated with a
+            # single matrix multiply each instead of one per mesh
+            meshes = list(self.model.sample.values())
+            if meshes:
+                offsets = np.cumsum([mesh.vertices.shape[0] for mesh in meshes[:-1]])
+                vertices = np.concatenate([mesh.vertices for mesh in meshes]) @ _matrix
+                normals = np.concatenate([mesh.normals for mesh in meshes]) @ _matrix
+                for mesh, v, n in zip(meshes, np.split(vertices, offsets), np.split(normals, offsets)):
+                    mesh.vertices = v
+                    mesh.normals = n
+
             self.model.fiducials.points = self.model.fiducials.points @ _matrix
             self.model.measurement_points.points = self.model.measurement_points.points @ _matrix
             for k in range(self.model.measurement_vectors.shape[2]):
@@ -129,12 +139,32 @@ class TransformSample(QtWidgets.QUndoCommand):
             mesh = self.model.sample[self.key]
             mesh.transform(matrix)
         else:
-            for key in self.model.sample.keys():
-                mesh = self.model.sample[key]
-                mesh.transform(matrix)
-
             _matrix = matrix[0:3, 0:3].transpose()
             _offset = matrix[0:3, 3].transpose()
+
+            # the affine transform is applied to the stacked vertices and
+            # normals of all the samples at once which avoids the per-mesh
+            # dispatch and the intermediate Mesh created by Mesh.transform
+            # a pure translation leaves the normals unchanged and an identity
+            # rotation with a zero offset leaves the meshes untouched
+            meshes = list(self.model.sample.values())
+            rotates = not np.array_equal(_matrix, np.eye(3))
+            translates = np.any(_offset)
+            if meshes and (rotates or translates):
+                offsets = np.cumsum([mesh.vertices.shape[0] for mesh in meshes[:-1]])
+                vertices = np.concatenate([mesh.vertices for mesh in meshes])
+                if rotates:
+                    vertices = vertices @ _matrix
+                    if translates:
+                        vertices += _offset
+                    normals = np.concatenate([mesh.normals for mesh in meshes]) @ _matrix
+                    for mesh, n in zip(meshes, np.split(normals, offsets)):
+                        mesh.normals = n
+                else:
+                    vertices = vertices + _offset
+                for mesh, v in zip(meshes, np.split(vertices, offsets)):
+                    mesh.vertices = v
+
             self.model.fiducials.points = self.model.fiducials.points @ _matrix + _offset
             self.model.measurement_points.points = self.model.measurement_points.points @ _matrix + _offset
             for k in range(self.model.measurement_vectors.shape[2]):
@@ -1,6 +1,30 @@
-from .misc import (ProgressDialog, ProjectDialog, AlignmentErrorDialog, SampleExportDialog,
-                   SimulationDialog, ScriptExportDialog, PathLengthPlotter, AboutDialog)
-from .preferences import Preferences
-from .insert import InsertPrimitiveDialog, InsertPointDialog, InsertVectorDialog, PickPointDialog, AlignSample
-from .managers import SampleManager, PointManager, VectorManager, JawControl, PositionerControl, DetectorControl
-from .tools import TransformDialog
+_modules = {'ProgressDialog': '.misc', 'ProjectDialog': '.misc', 'AlignmentErrorDialog': '.misc',
+            'SampleExportDialog': '.misc', 'SimulationDialog': '.misc', 'ScriptExportDialog': '.misc',
+            'PathLengthPlotter': '.misc', 'AboutDialog': '.misc',
+            'Preferences': '.preferences',
+            'InsertPrimitiveDialog': '.insert', 'InsertPointDialog': '.insert', 'InsertVectorDialog': '.insert',
+            'PickPointDialog': '.insert', 'AlignSample': '.insert',
+            'SampleManager': '.managers', 'PointManager': '.managers', 'VectorManager': '.managers',
+            'JawControl': '.managers', 'PositionerControl': '.managers', 'DetectorControl': '.managers',
+            'TransformDialog': '.tools'}
+
+__all__ = list(_modules.keys())
+
+
+def __getattr__(name):
+    """Imports the module for a dialog class on first access (PEP 562) so
+    importing the package does not eagerly load every dialog at startup
+
+    :param name: name of dialog class
+    :type name: str
+    :return: dialog class
+    :rtype: Type
+    """
+    module_name = _modules.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -156,7 +156,7 @@ class GLWidget(QtWidgets.QOpenGLWidget):
             self.renderAxis()
 
         for node in self.scene.nodes:
-            self.recursiveDraw(node)
+            self.drawNodeTree(node)
 
         if self.show_bounding_box:
             self.renderBoundingBox()
@@ -164,15 +164,38 @@ class GLWidget(QtWidgets.QOpenGLWidget):
         if self.picks:
             self.renderPicks()
 
-    def recursiveDraw(self, node):
-        """Recursive renders node from the scene with its children
+    def drawNodeTree(self, root):
+        """Renders a node from the scene with its children. The tree is
+        traversed pre-order with an explicit stack which avoids the Python
+        call overhead and recursion limit of a recursive walk
 
-        :param node: node
-        :type: Node
+        :param root: root node
+        :type root: Node
         """
-        if not node.visible:
-            return
+        stack = [(root, False)]
+        while stack:
+            node, processed = stack.pop()
+            if processed:
+                GL.glPopAttrib()
+                GL.glPopMatrix()
+                continue
+
+            if not node.visible:
+                continue
+
+            self.drawNode(node)
+            stack.append((node, True))
+            for child in reversed(node.children):
+                stack.append((child, False))
+
+    def drawNode(self, node):
+        """Sets up render state for a node and renders its geometry. The
+        matrix and attribute state pushed here is popped by the caller after
+        the node's children have been drawn
 
+        :param node: node
+        :type node: Node
+        """
         GL.glPushMatrix()
         GL.glPushAttrib(GL.GL_CURRENT_BIT)
         GL.glMultTransposeMatrixf(node.transform)
@@ -216,12 +239,6 @@ class GLWidget(QtWidgets.QOpenGLWidget):
         GL.glDepthMask(GL.GL_TRUE)
         GL.glDisable(GL.GL_BLEND)
 
-        for child in node.children:
-            self.recursiveDraw(child)
-
-        GL.glPopAttrib()
-        GL.glPopMatrix()
-
     def renderNode(self, node):
         """Renders a leaf node (node with no child) from the scene
 
@@ -127,19 +127,19 @@ class MainWindow(QtWidgets.QMainWindow):
         self.preferences_action.setShortcut(QtGui.QKeySequence('Ctrl+Shift+P'))
 
         # View Menu Actions
-        self.solid_render_action = QtWidgets.QAction(Node.RenderMode.Solid.value, self)
+        self.solid_render_action = QtWidgets.QAction(Node.RenderMode.Solid.name, self)
         self.solid_render_action.setStatusTip('Render sample as solid object')
         self.solid_render_action.setIcon(QtGui.QIcon(path_for('solid.png')))
         self.solid_render_action.triggered.connect(lambda: self.scenes.changeRenderMode(Node.RenderMode.Solid))
         self.solid_render_action.setCheckable(True)
 
-        self.line_render_action = QtWidgets.QAction(Node.RenderMode.Wireframe.value, self)
+        self.line_render_action = QtWidgets.QAction(Node.RenderMode.Wireframe.name, self)
         self.line_render_action.setStatusTip('Render sample as wireframe object')
         self.line_render_action.setIcon(QtGui.QIcon(path_for('wireframe.png')))
         self.line_render_action.triggered.connect(lambda: self.scenes.changeRenderMode(Node.RenderMode.Wireframe))
         self.line_render_action.setCheckable(True)
 
-        self.blend_render_action = QtWidgets.QAction(Node.RenderMode.Transparent.value, self)
+        self.blend_render_action = QtWidgets.QAction(Node.RenderMode.Transparent.name, self)
         self.blend_render_action.setStatusTip('Render sample as transparent object')
         self.blend_render_action.setIcon(QtGui.QIcon(path_for('blend.png')))
         self.blend_render_action.triggered.connect(lambda: self.scenes.changeRenderMode(Node.RenderMode.Transparent))
@@ -16,6 +16,18 @@ class TestSignal:
         self.call(*args)
 
 
+def attach_worker_signals(worker):
+    """Attaches fresh test signals to a worker mock. The signals hold the last
+    connected slot so they are not shared between tests
+
+    :param worker: worker mock instance
+    :type worker: unittest.mock.Mock
+    """
+    worker.job_succeeded = TestSignal()
+    worker.job_failed = TestSignal()
+    worker.finished = TestSignal()
+
+
 class TestView(QMainWindow):
     def __init__(self):
         super().__init__()
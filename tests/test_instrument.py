@@ -216,6 +216,12 @@ class TestInstrument(unittest.TestCase):
         expected_result = [[1, 0, 0, 1], [0, 1, 0, 1], [0, 0, 1, 0], [0, 0, 0, 1]]
         np.testing.assert_array_almost_equal(expected_result, pose, decimal=5)
 
+        # a revolute link's mesh is translated by the joint position before the
+        # link, so the second mesh sits at the end of the first link
+        node = s.model()
+        np.testing.assert_array_almost_equal(node.children[1].transform[0:3, 3], [0, 0, 0], decimal=5)
+        np.testing.assert_array_almost_equal(node.children[2].transform[0:3, 3], [0, 1, 0], decimal=5)
+
         s.set_points = [-np.pi/2, np.pi/4]
         self.assertAlmostEqual(s.links[0].set_point, -np.pi/2, 5)
         self.assertAlmostEqual(s.links[1].set_point, np.pi/4, 5)